@@ -1,33 +1,79 @@
 import os
+import sys
 import time
 import shutil
 import json
+import hashlib
+import mmap
+import queue
+import re
+import functools
+import tempfile
+import threading
+import zipfile
+import ctypes
+
+# Platform-specific modules for keyboard input and native file copies
+if sys.platform == "win32":
+    import msvcrt
+    fcntl = termios = None
+else:
+    import fcntl
+    import termios
+    msvcrt = None
+
+# Optional: filesystem event notifications instead of polling (pip install watchdog)
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+# Optional: zstd-compressed backups (pip install zstandard)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 # Settings file path
 SETTINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'eu4_autobackup.json')
+# Cached metadata: in-game year of each backup file (checked against mtime and size)
+# and the in-game date of the last backup of each save file
+BACKUP_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'eu4_autobackup_cache.json')
+
+# date= and player= live in the save header; only this many bytes are read to find them
+SAVE_HEADER_SIZE = 8192
+SAVE_HEADER_MAX_SIZE = 65536
+_DATE_RE = re.compile(rb'(?m)^date="?(\d{1,4})\.(\d{1,2})\.(\d{1,2})')
+_PLAYER_RE = re.compile(rb'(?m)^player="?([A-Z0-9\-]+)')
+
+# Buffer size for the userspace copy fallback
+COPY_BUFSIZE = 1024 * 1024
+
+# When polling, a changed save must keep its size and mtime for this long before it is copied
+SAVE_STABLE_DELAY = 0.2
+
+# Compressed backups get this suffix; ironman saves are zip archives and are never recompressed
+ZSTD_SUFFIX = '.zst'
+BACKUP_NAME_PREFIX = 'mp_autosave_'  # Filename prefix of every backup written by this script
+ZIP_MAGIC = b'PK\x03\x04'
+
+# User's home directory and common save game locations, resolved once
+_USER_HOME = os.path.expanduser("~")
+COMMON_SAVE_LOCATIONS = [
+    os.path.join(_USER_HOME, "Documents", "Paradox Interactive", "Europa Universalis IV", "save games"),
+    os.path.join("C:", os.sep, "Users", os.getenv("USERNAME", ""), "Documents", "Paradox Interactive", "Europa Universalis IV", "save games"),
+    os.path.join("D:", os.sep, "Documents", "Paradox Interactive", "Europa Universalis IV", "save games"),
+    os.path.join("C:", os.sep, "Documents", "Paradox Interactive", "Europa Universalis IV", "save games"),
+]
 
+@functools.lru_cache(maxsize=1)
 def detect_eu4_save_paths():
-    """Auto-detect common EU4 save game locations."""
-    possible_paths = []
-    
-    # Get user's home directory
-    user_home = os.path.expanduser("~")
-    
-    # Common save game locations
-    common_locations = [
-        os.path.join(user_home, "Documents", "Paradox Interactive", "Europa Universalis IV", "save games"),
-        os.path.join("C:", os.sep, "Users", os.getenv("USERNAME", ""), "Documents", "Paradox Interactive", "Europa Universalis IV", "save games"),
-        os.path.join("D:", os.sep, "Documents", "Paradox Interactive", "Europa Universalis IV", "save games"),
-        os.path.join("C:", os.sep, "Documents", "Paradox Interactive", "Europa Universalis IV", "save games"),
-    ]
-    
-    # Check each possible location
-    for path in common_locations:
-        if os.path.exists(path):
-            possible_paths.append(path)
-    
-    return possible_paths
+    """Auto-detect common EU4 save game locations (cached, see _invalidate_path_cache)."""
+    return [path for path in COMMON_SAVE_LOCATIONS if os.path.exists(path)]
 
+@functools.lru_cache(maxsize=1)
 def detect_autosave_file():
     """Find the mp_autosave.eu4 file in detected save locations."""
     save_paths = detect_eu4_save_paths()
@@ -39,6 +85,11 @@ def detect_autosave_file():
     
     return None
 
+def _invalidate_path_cache():
+    """Forget cached detection results so the next lookup probes the filesystem again."""
+    detect_eu4_save_paths.cache_clear()
+    detect_autosave_file.cache_clear()
+
 def get_detected_paths():
     """Get detected paths for EU4 installation."""
     detected_autosave = detect_autosave_file()
@@ -54,8 +105,7 @@ def get_detected_paths():
         backup_dir = os.path.join(detected_save_dirs[0], "backups")
     else:
         # Fallback to user's Documents folder
-        user_home = os.path.expanduser("~")
-        eu4_dir = os.path.join(user_home, "Documents", "Paradox Interactive", "Europa Universalis IV", "save games")
+        eu4_dir = os.path.join(_USER_HOME, "Documents", "Paradox Interactive", "Europa Universalis IV", "save games")
         source_file = os.path.join(eu4_dir, "mp_autosave.eu4")
         backup_dir = os.path.join(eu4_dir, "backups")
     
@@ -73,9 +123,14 @@ DEFAULT_SETTINGS = {
     'SOURCE': default_source,
     'BACKUP_DIR': default_backup,
     'interval': 60.0,
-    'keep_years': 'all'
+    'keep_years': 'all',
+    'compress': False,
+    'dedup_by': 'day'
 }
 
+# How much of the in-game date (year, month, day) must match the last backup to skip a save
+DEDUP_DATE_PARTS = {'year': 1, 'month': 2, 'day': 3, 'off': 0}
+
 def load_settings():
     """Read settings from the JSON file or use defaults."""
     if os.path.exists(SETTINGS_FILE):
@@ -99,80 +154,157 @@ def load_settings():
             pass
     return DEFAULT_SETTINGS.copy()
 
+def write_json_atomic(path, data, indent=None):
+    """Write JSON to a temporary file and move it into place, so a crash never leaves a half-written file."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
 def save_settings(settings):
     """Write settings to the JSON file."""
-    with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(settings, f, indent=2)
+    write_json_atomic(SETTINGS_FILE, settings, indent=2)
 
 def update_setting(settings, key, value):
     """Update a setting and save."""
     settings[key] = value
     save_settings(settings)
 
+def update_settings(settings, **values):
+    """Update several settings and save them with a single write."""
+    settings.update(values)
+    save_settings(settings)
+
 def delete_setting(settings, key):
     """Delete a setting and save."""
     if key in settings:
         del settings[key]
         save_settings(settings)
 
+# ANSI color codes for log(), pre-rendered into '%s' templates once
+LOG_COLORS = {
+    'green': '\033[92m',
+    'yellow': '\033[93m',
+    'blue': '\033[94m',
+    'red': '\033[91m',
+    'reset': '\033[0m',
+}
+# '%s%s' format strings (timestamp, message) per (color, emoji) pair, built on first use
+_LOG_FORMATS = {}
+_STDOUT_WRITE = sys.stdout.write
+
+# Timestamp prefix of the current second, so time.strftime runs at most once per second
+_log_ts_second = None
+_log_ts_prefix = ''
+
+def _log_timestamp():
+    """Return the '[YYYY-MM-DD HH:MM:SS] ' prefix for the current second."""
+    global _log_ts_second, _log_ts_prefix
+    now = int(time.time())
+    if now != _log_ts_second:
+        _log_ts_prefix = time.strftime('[%Y-%m-%d %H:%M:%S] ', time.localtime(now))
+        _log_ts_second = now
+    return _log_ts_prefix
+
 def log(msg, color=None, emoji=None):
     # Print a timestamped, colored, emoji-enhanced log message
-    colors = {
-        'green': '\033[92m',
-        'yellow': '\033[93m',
-        'blue': '\033[94m',
-        'red': '\033[91m',  # Add red color
-        'reset': '\033[0m',
-    }
-    prefix = f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] "
-    emoji_str = f"{emoji} " if emoji else ""
-    color_code = colors.get(color, '')
-    reset_code = colors['reset'] if color else ''
-    print(f"{color_code}{prefix}{emoji_str}{msg}{reset_code}")
+    fmt = _LOG_FORMATS.get((color, emoji))
+    if fmt is None:
+        fmt = "%s{} %s".format(emoji.replace('%', '%%')) if emoji else "%s%s"
+        if color in LOG_COLORS:
+            fmt = f"{LOG_COLORS[color]}{fmt}{LOG_COLORS['reset']}"
+        fmt = _LOG_FORMATS[(color, emoji)] = fmt + '\n'
+    _STDOUT_WRITE(fmt % (_log_timestamp(), msg))
+
+# Pre-rendered menu text, written with a single call per redraw
+_HEADER_BAR = "=" * 50
+_SETTINGS_HEADER = f"\n{_HEADER_BAR}\n  📋 CURRENT SETTINGS\n{_HEADER_BAR}\n"
+_SETTING_DESCRIPTIONS = {
+    'SOURCE': 'EU4 autosave file location',
+    'BACKUP_DIR': 'Backup directory location',
+    'interval': 'Check interval (seconds)',
+    'keep_years': 'Backup retention (years or "all")',
+    'compress': 'Compress backups with zstd (.eu4.zst)',
+    'dedup_by': 'Skip saves with the same in-game day/month/year ("off" keeps all)'
+}
+_MAIN_MENU = "\n".join([
+    "",
+    _HEADER_BAR,
+    "  🎮 EU4 AUTOBACKUP - SETTINGS",
+    _HEADER_BAR,
+    "  1. 📋 Show current settings",
+    "  2. 📁 Update source file path",
+    "  3. 🗂️ Update backup directory",
+    "  4. ⏱️ Update check interval",
+    "  5. 🗑️ Update backup retention",
+    "  6. 🔧 Run setup wizard (auto-detect & configure)",
+    "  7. 🔄 Reset to defaults",
+    "  8. 🚀 Start backup monitoring",
+    "  9. 🗜️ Toggle backup compression",
+    "  0. 👋 Exit",
+    "-" * 50,
+]) + "\n"
+_WELCOME_BANNER = "\n".join([
+    "",
+    "=" * 60,
+    "  🎮 WELCOME TO EU4 AUTOBACKUP - FIRST TIME SETUP",
+    "=" * 60,
+    "  Let's configure your EU4 backup settings!",
+    "  We'll try to auto-detect your EU4 installation...",
+    "",
+]) + "\n"
+
+def write_block(text):
+    """Write a block of text to the console in one call and flush it."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
 
 # Print all current settings to the console
 def show_settings(settings):
     """Print current settings with descriptions."""
-    print("\n" + "="*50)
-    print("  📋 CURRENT SETTINGS")
-    print("="*50)
+    lines = [_SETTINGS_HEADER]
     
     # Format settings with descriptions
-    setting_descriptions = {
-        'SOURCE': 'EU4 autosave file location',
-        'BACKUP_DIR': 'Backup directory location',
-        'interval': 'Check interval (seconds)',
-        'keep_years': 'Backup retention (years or "all")'
-    }
-    
     for key, value in settings.items():
-        desc = setting_descriptions.get(key, 'Custom setting')
-        print(f"  {key.ljust(12)}: {str(value).ljust(40)} # {desc}")
+        desc = _SETTING_DESCRIPTIONS.get(key, 'Custom setting')
+        lines.append(f"  {key.ljust(12)}: {str(value).ljust(40)} # {desc}\n")
     
     # Show file existence status
-    print("\n📁 FILE STATUS:")
     source_exists = "✅ EXISTS" if os.path.exists(settings.get('SOURCE', '')) else "❌ NOT FOUND"
     backup_exists = "✅ EXISTS" if os.path.exists(settings.get('BACKUP_DIR', '')) else "❌ NOT FOUND"
-    print(f"  Source file   : {source_exists}")
-    print(f"  Backup dir    : {backup_exists}")
-    print("="*50)
+    lines.append("\n📁 FILE STATUS:\n")
+    lines.append(f"  Source file   : {source_exists}\n")
+    lines.append(f"  Backup dir    : {backup_exists}\n")
+    lines.append(f"{_HEADER_BAR}\n")
+    write_block("".join(lines))
 
 
 def validate_path_input(prompt, current_value, is_file=True):
     """Get and validate file/directory path input with smart suggestions."""
+    # Help text is shown once; only the prompt repeats after invalid input
+    print(f"\nCurrent: {current_value}")
+    
+    # Show suggestions for EU4 paths
+    detected_paths = []
+    if 'autosave' in prompt.lower() or 'source' in prompt.lower():
+        detected_paths = detect_eu4_save_paths()
+        if detected_paths:
+            print("💡 Detected EU4 save directories:")
+            for i, path in enumerate(detected_paths[:3], 1):  # Show up to 3
+                autosave_path = os.path.join(path, "mp_autosave.eu4")
+                status = "✅" if os.path.exists(autosave_path) else "📁"
+                print(f"    {i}. {status} {autosave_path}")
+    
     while True:
-        print(f"\nCurrent: {current_value}")
-        
-        # Show suggestions for EU4 paths
-        if 'autosave' in prompt.lower() or 'source' in prompt.lower():
-            detected_paths = detect_eu4_save_paths()
-            if detected_paths:
-                print("💡 Detected EU4 save directories:")
-                for i, path in enumerate(detected_paths[:3], 1):  # Show up to 3
-                    autosave_path = os.path.join(path, "mp_autosave.eu4")
-                    status = "✅" if os.path.exists(autosave_path) else "📁"
-                    print(f"    {i}. {status} {autosave_path}")
-        
         value = input(f"{prompt} (Enter to keep current, number to select above, 'search' to find files): ").strip()
         
         if value == '':
@@ -180,7 +312,6 @@ def validate_path_input(prompt, current_value, is_file=True):
         elif value.isdigit() and 'autosave' in prompt.lower():
             # User selected a numbered option
             try:
-                detected_paths = detect_eu4_save_paths()
                 selected_idx = int(value) - 1
                 if 0 <= selected_idx < len(detected_paths):
                     selected_path = os.path.join(detected_paths[selected_idx], "mp_autosave.eu4")
@@ -192,6 +323,7 @@ def validate_path_input(prompt, current_value, is_file=True):
                 pass
         elif value.lower() == 'search':
             log("Searching for EU4 files...", color='blue', emoji='🔍')
+            _invalidate_path_cache()
             detected_autosave = detect_autosave_file()
             if detected_autosave:
                 log(f"Found: {detected_autosave}", color='green', emoji='✅')
@@ -217,9 +349,8 @@ def validate_path_input(prompt, current_value, is_file=True):
                 # Show common EU4 locations as hints
                 if 'eu4' in prompt.lower() or 'europa' in prompt.lower():
                     log("💡 Try checking these common locations:", color='blue', emoji='💡')
-                    user_home = os.path.expanduser("~")
                     hints = [
-                        os.path.join(user_home, "Documents", "Paradox Interactive", "Europa Universalis IV", "save games"),
+                        os.path.join(_USER_HOME, "Documents", "Paradox Interactive", "Europa Universalis IV", "save games"),
                         "C:\\Program Files (x86)\\Steam\\steamapps\\common\\Europa Universalis IV"
                     ]
                     for hint in hints:
@@ -240,13 +371,10 @@ def validate_path_input(prompt, current_value, is_file=True):
 
 def first_run_setup():
     """Guide users through initial setup with auto-detection."""
-    print("\n" + "="*60)
-    print("  🎮 WELCOME TO EU4 AUTOBACKUP - FIRST TIME SETUP")
-    print("="*60)
-    print("  Let's configure your EU4 backup settings!")
-    print("  We'll try to auto-detect your EU4 installation...\n")
+    write_block(_WELCOME_BANNER)
     
     # Auto-detect and show results
+    _invalidate_path_cache()
     detected_save_dirs = detect_eu4_save_paths()
     detected_autosave = detect_autosave_file()
     
@@ -260,9 +388,8 @@ def first_run_setup():
     else:
         log("❌ Could not auto-detect EU4 installation", color='red', emoji='❌')
         log("💡 Common locations to check:", color='blue', emoji='💡')
-        user_home = os.path.expanduser("~")
         suggestions = [
-            os.path.join(user_home, "Documents", "Paradox Interactive", "Europa Universalis IV", "save games"),
+            os.path.join(_USER_HOME, "Documents", "Paradox Interactive", "Europa Universalis IV", "save games"),
             "C:\\Program Files (x86)\\Steam\\steamapps\\common\\Europa Universalis IV",
             "C:\\Program Files\\Epic Games\\Europa Universalis IV"
         ]
@@ -317,7 +444,9 @@ def first_run_setup():
         'SOURCE': final_source,
         'BACKUP_DIR': final_backup,
         'interval': interval,
-        'keep_years': 'all'
+        'keep_years': 'all',
+        'compress': False,
+        'dedup_by': 'day'
     }
     
     # Save settings
@@ -333,9 +462,9 @@ def first_run_setup():
 
 def validate_interval_input(current_value):
     """Get and validate interval input."""
+    print(f"\nCurrent interval: {current_value} seconds")
+    print("Suggestions: 30 (30s), 60 (1min), 300 (5min), 600 (10min)")
     while True:
-        print(f"\nCurrent interval: {current_value} seconds")
-        print("Suggestions: 30 (30s), 60 (1min), 300 (5min), 600 (10min)")
         value = input("Enter new interval in seconds (Enter to keep current): ").strip()
         
         if value == '':
@@ -356,11 +485,11 @@ def validate_interval_input(current_value):
 
 def validate_keep_years_input(current_value):
     """Get and validate keep_years input."""
+    print(f"\nCurrent setting: {current_value}")
+    print("Options:")
+    print("  'all'  - Keep all backups (no cleanup)")
+    print("  Number - Years of backups to keep (e.g., 50 keeps last 50 in-game years)")
     while True:
-        print(f"\nCurrent setting: {current_value}")
-        print("Options:")
-        print("  'all'  - Keep all backups (no cleanup)")
-        print("  Number - Years of backups to keep (e.g., 50 keeps last 50 in-game years)")
         value = input("Enter new value (Enter to keep current): ").strip()
         
         if value == '':
@@ -385,21 +514,9 @@ def validate_keep_years_input(current_value):
 def settings_menu(settings):
     """Enhanced interactive CLI for settings management."""
     while True:
-        print("\n" + "="*50)
-        print("  🎮 EU4 AUTOBACKUP - SETTINGS")
-        print("="*50)
-        print("  1. 📋 Show current settings")
-        print("  2. 📁 Update source file path")
-        print("  3. 🗂️ Update backup directory")
-        print("  4. ⏱️ Update check interval")
-        print("  5. 🗑️ Update backup retention")
-        print("  6. 🔧 Run setup wizard (auto-detect & configure)")
-        print("  7. 🔄 Reset to defaults")
-        print("  8. 🚀 Start backup monitoring")
-        print("  0. 👋 Exit")
-        print("-"*50)
+        write_block(_MAIN_MENU)
         
-        choice = input("Select option (0-8): ").strip()
+        choice = input("Select option (0-9): ").strip()
         
         if choice == '1':
             show_settings(settings)
@@ -448,6 +565,7 @@ def settings_menu(settings):
             print("\n🔧 Running setup wizard with auto-detection...")
             
             # First try quick auto-detection
+            _invalidate_path_cache()
             detected_autosave = detect_autosave_file()
             detected_dirs = detect_eu4_save_paths()
             
@@ -460,9 +578,8 @@ def settings_menu(settings):
                 
                 quick_choice = input("Choose option (1-3): ").strip()
                 if quick_choice == '1':
-                    update_setting(settings, 'SOURCE', detected_autosave)
                     backup_dir = os.path.join(os.path.dirname(detected_autosave), "backups")
-                    update_setting(settings, 'BACKUP_DIR', backup_dir)
+                    update_settings(settings, SOURCE=detected_autosave, BACKUP_DIR=backup_dir)
                     log("Paths updated automatically!", color='green', emoji='✅')
                 elif quick_choice == '2':
                     new_settings = first_run_setup()
@@ -516,117 +633,485 @@ def settings_menu(settings):
             log("Starting backup monitoring...", color='blue', emoji='🚀')
             break
                 
+        elif choice == '9':
+            if zstandard is None:
+                log("Compression needs the zstandard package (pip install zstandard)", color='yellow', emoji='⚠️')
+                continue
+            enabled = not settings.get('compress', DEFAULT_SETTINGS['compress'])
+            update_setting(settings, 'compress', enabled)
+            if enabled:
+                log("Backup compression enabled! Decompress .eu4.zst backups before loading them in EU4.", color='green', emoji='✅')
+            else:
+                log("Backup compression disabled!", color='green', emoji='✅')
+                
         elif choice == '0':
+            wait_for_backups()
             log("Goodbye!", color='blue', emoji='👋')
             exit(0)
             
         else:
-            log("Invalid choice. Please select 0-8.", color='yellow', emoji='⚠️')
+            log("Invalid choice. Please select 0-9.", color='yellow', emoji='⚠️')
 
-def get_mtime(path):
-    """Return the last modification time of a file, or None if not found."""
+def get_stat(path):
+    """Return the os.stat result of a file, or None if not found."""
     try:
-        return os.path.getmtime(path)
+        return os.stat(path)
     except FileNotFoundError:
         return None
 
-def get_player_tag(save_path):
-    """Extract the player country tag from the EU4 save file."""
+# Last parsed save header and content signature, keyed by (path, mtime, size)
+_save_header_memo = {}
+
+def _search_header(head, end):
+    """Return (date, tag) found in the first `end` bytes of head; either may be None."""
+    date_match = _DATE_RE.search(head, 0, end)
+    player_match = _PLAYER_RE.search(head, 0, end)
+    date = tuple(int(part) for part in date_match.groups()) if date_match else None
+    tag = player_match.group(1).decode('ascii') if player_match else None
+    return date, tag
+
+def read_zstd_prefix(path, size):
+    """Decompress and return the first `size` bytes of a zstd-compressed backup."""
+    if zstandard is None:
+        return b''
+    chunks = []
+    remaining = size
+    with open(path, 'rb') as f, zstandard.ZstdDecompressor().stream_reader(f) as reader:
+        while remaining > 0:
+            chunk = reader.read(remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+    return b''.join(chunks)
+
+def read_zip_meta_prefix(file, size):
+    """Return the first `size` bytes of the 'meta' entry of a compressed (zip) save (path or open binary file)."""
+    with zipfile.ZipFile(file) as archive, archive.open('meta') as meta:
+        return meta.read(size)
+
+def read_save_header(save_path, digest=None):
+    """Extract the player country tag and in-game date (year, month, day) from the header of an EU4 save file.
+
+    If a hashlib object is passed as `digest`, it is fed the file size and raw header bytes from the same read.
+    """
+    tag, date = None, None
     try:
-        # Try reading as binary first, then decode what we can
-        with open(save_path, 'rb') as f:
-            content = f.read()
-            # Convert to string, ignoring errors
-            text_content = content.decode('utf-8', errors='ignore')
-            
-            # Look for player= line
-            for line in text_content.split('\n'):
-                if line.strip().startswith('player='):
-                    tag = line.split('=')[1].strip().strip('"')
-                    if tag and tag != '---':  # EU4 sometimes uses --- for no player
-                        return tag
-                    
-        # If binary approach didn't work, try UTF-8 with error handling
-        with open(save_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                if line.startswith('player='):
-                    tag = line.split('=')[1].strip().strip('"')
-                    if tag and tag != '---':
-                        return tag
-                        
+        if save_path.endswith(ZSTD_SUFFIX):
+            head = read_zstd_prefix(save_path, SAVE_HEADER_MAX_SIZE)
+            date, tag = _search_header(head, len(head))
+        else:
+            with open(save_path, 'rb') as f:
+                file_size = os.fstat(f.fileno()).st_size
+                size = min(file_size, SAVE_HEADER_MAX_SIZE)
+                if digest is not None:
+                    digest.update(file_size.to_bytes(8, 'little'))
+                if size:
+                    # Scan the mapped page cache directly instead of copying the header into memory
+                    with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as head:
+                        if digest is not None:
+                            digest.update(head)
+                        is_zip = head[:len(ZIP_MAGIC)] == ZIP_MAGIC
+                        if not is_zip:
+                            date, tag = _search_header(head, SAVE_HEADER_SIZE)
+                            # Retry with a larger window if the header is longer than usual
+                            if date is None or tag is None:
+                                date, tag = _search_header(head, size)
+                    # Compressed saves keep the header in their 'meta' entry; reuse the open handle
+                    if is_zip:
+                        head = read_zip_meta_prefix(f, SAVE_HEADER_MAX_SIZE)
+                        date, tag = _search_header(head, len(head))
     except Exception as e:
-        log(f"Warning: Could not extract player tag: {e}", color='yellow', emoji='⚠️')
-        pass
-    return 'UNKNOWN'
+        log(f"Warning: Could not read save header: {e}", color='yellow', emoji='⚠️')
+    
+    if not tag or tag == '---':  # EU4 sometimes uses --- for no player
+        tag = 'UNKNOWN'
+    return tag, date
 
-def get_save_year(save_path):
-    """Extract the in-game year from the EU4 save file (date=YYYY.M.D)."""
-    try:
-        # Try reading as binary first, then decode what we can
-        with open(save_path, 'rb') as f:
-            content = f.read()
-            text_content = content.decode('utf-8', errors='ignore')
-            
-            for line in text_content.split('\n'):
-                if line.strip().startswith('date='):
-                    date_str = line.split('=')[1].strip().strip('"')
-                    year = int(date_str.split('.')[0])
-                    return year
-                    
-        # Fallback to UTF-8 with error handling
-        with open(save_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                if line.startswith('date='):
-                    date_str = line.split('=')[1].strip().strip('"')
-                    year = int(date_str.split('.')[0])
-                    return year
-    except Exception:
-        pass
-    return None
+def read_save_info(save_path):
+    """Return (tag, date, signature) of a save; the signature hashes size, header bytes and date in the same pass."""
+    digest = hashlib.blake2b(digest_size=16)
+    tag, date = read_save_header(save_path, digest)
+    digest.update(str(date).encode('ascii'))
+    return tag, date, digest.digest()
+
+def get_save_info(save_path, st=None):
+    """Return (player tag, in-game date, content signature) of the save file, reusing the last result if unchanged.
+
+    Pass the file's os.stat result as `st` if the caller already has it.
+    """
+    if st is None:
+        st = get_stat(save_path)
+        if st is None:
+            return 'UNKNOWN', None, None
+    key = (save_path, st.st_mtime_ns, st.st_size)
+    if key not in _save_header_memo:
+        _save_header_memo.clear()
+        _save_header_memo[key] = read_save_info(save_path)
+    return _save_header_memo[key]
 
 def get_backup_year(filename):
-    """Extract the in-game year from a backup filename (if present)."""
+    """Extract the in-game year from a backup file."""
+    date = read_save_header(filename)[1]
+    return date[0] if date else None
+
+def load_backup_cache():
+    """Read cached backup metadata from the JSON file, or return an empty cache."""
+    cache = {}
     try:
-        # Try reading as binary first, then decode what we can
-        with open(filename, 'rb') as f:
-            content = f.read()
-            text_content = content.decode('utf-8', errors='ignore')
-            
-            for line in text_content.split('\n'):
-                if line.strip().startswith('date='):
-                    date_str = line.split('=')[1].strip().strip('"')
-                    year = int(date_str.split('.')[0])
-                    return year
-                    
-        # Fallback to UTF-8 with error handling
-        with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                if line.startswith('date='):
-                    date_str = line.split('=')[1].strip().strip('"')
-                    year = int(date_str.split('.')[0])
-                    return year
+        with open(BACKUP_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
     except Exception:
         pass
-    return None
+    if not isinstance(cache, dict) or not isinstance(cache.get('backups'), dict):
+        cache = {'backups': {}}
+    if not isinstance(cache.get('last_dates'), dict):
+        cache['last_dates'] = {}
+    return cache
+
+def save_backup_cache(cache):
+    """Atomically write cached backup metadata to the JSON file."""
+    try:
+        write_json_atomic(BACKUP_CACHE_FILE, cache)
+    except Exception as e:
+        log(f"Warning: Could not write backup cache: {e}", color='yellow', emoji='⚠️')
+
+# Highest retention threshold (oldest year kept) already applied, per backup directory
+_cleanup_thresholds = {}
 
 def cleanup_old_backups(backup_dir, current_year, keep_years):
     """Delete backups older than current_year - keep_years. If keep_years is 'all', keep all backups."""
     if keep_years == 'all':
         return
     try:
-        keep_years = int(keep_years)
+        threshold = current_year - int(keep_years)
     except (TypeError, ValueError):
         return
-    for fname in os.listdir(backup_dir):
-        if fname.endswith('.eu4'):
-            fpath = os.path.join(backup_dir, fname)
-            backup_year = get_backup_year(fpath)
-            if backup_year is not None and backup_year < current_year - keep_years:
+    # Nothing new can have expired unless the threshold moved forward since the last scan
+    if threshold <= _cleanup_thresholds.get(backup_dir, float('-inf')):
+        return
+    _cleanup_thresholds[backup_dir] = threshold
+    cache = load_backup_cache()
+    backups = cache['backups']
+    fresh_backups = {}
+    with os.scandir(backup_dir) as entries:
+        for entry in entries:
+            # is_file() uses the type cached by the directory scan, no extra syscall
+            name = entry.name
+            # Only our own backups are considered; other saves in the folder are never parsed or deleted
+            if not name.startswith(BACKUP_NAME_PREFIX) or not name.endswith(('.eu4', '.eu4' + ZSTD_SUFFIX)):
+                continue
+            if not entry.is_file():
+                continue
+            # Only re-read the file if it changed since it was last parsed
+            st = entry.stat()
+            cached = backups.get(entry.path)
+            if cached and cached.get('mtime_ns') == st.st_mtime_ns and cached.get('size') == st.st_size:
+                backup_year = cached.get('year')
+            else:
+                backup_year = get_backup_year(entry.path)
+            if backup_year is not None and backup_year < threshold:
                 try:
-                    os.remove(fpath)
-                    log(f"🗑️  Cleaned up old backup: {fname} (Year {backup_year})", color='red', emoji='🧹')
+                    os.unlink(entry.path)
+                    log(f"🗑️  Cleaned up old backup: {name} (Year {backup_year})", color='red', emoji='🧹')
+                    continue
                 except Exception:
                     pass
+            fresh_backups[entry.path] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'year': backup_year}
+    # Entries of other backup directories are kept as they are
+    prefix = os.path.join(backup_dir, '')
+    for path, meta in backups.items():
+        if not path.startswith(prefix):
+            fresh_backups[path] = meta
+    if fresh_backups != backups:
+        cache['backups'] = fresh_backups
+        save_backup_cache(cache)
+
+def _copy_file2(src, dst):
+    """Copy a file with the native Windows CopyFile2 API (raises OSError on failure)."""
+    copy_file2 = ctypes.windll.kernel32.CopyFile2
+    copy_file2.argtypes = (ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_void_p)
+    copy_file2.restype = ctypes.HRESULT
+    copy_file2(src, dst, None)
+
+@functools.lru_cache(maxsize=1)
+def _libsystem():
+    """Load macOS libSystem once for the native copy functions."""
+    return ctypes.CDLL('/usr/lib/libSystem.B.dylib', use_errno=True)
+
+def _clonefile(src, dst):
+    """Clone src to a new file dst with macOS clonefile(2) (APFS copy-on-write, no data is copied)."""
+    if _libsystem().clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno))
+
+def _fcopyfile(fd_in, fd_out):
+    """Copy file data between descriptors with macOS fcopyfile(3)."""
+    COPYFILE_DATA = 1 << 3
+    if _libsystem().fcopyfile(fd_in, fd_out, None, COPYFILE_DATA) != 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno))
+
+def _ficlone(fd_in, fd_out):
+    """Share the source's data blocks with the destination via the FICLONE ioctl (Btrfs, XFS)."""
+    FICLONE = 0x40049409
+    fcntl.ioctl(fd_out, FICLONE, fd_in)
+
+def _copy_file_range(fd_in, fd_out, size):
+    """Copy file data inside the kernel with copy_file_range(2) (Linux 4.5+, Python 3.8+)."""
+    offset = 0
+    while offset < size:
+        copied = os.copy_file_range(fd_in, fd_out, size - offset, offset, offset)
+        if copied == 0:
+            break
+        offset += copied
+
+def _sendfile(fd_in, fd_out, size):
+    """Copy file data inside the kernel with sendfile(2)."""
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(fd_out, fd_in, offset, size - offset)
+        if sent == 0:
+            break
+        offset += sent
+
+def _advise_sequential(fd):
+    """Tell the kernel the file will be read front to back (no-op where posix_fadvise is missing)."""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+def _drop_from_page_cache(fd):
+    """Flush a written backup and let the kernel evict its pages, so it does not crowd out the game's data."""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.fdatasync(fd)  # DONTNEED only drops clean pages
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+# Index of the first in-kernel copy method that worked, per (source, destination) st_dev pair
+_kernel_copier_index = {}
+
+def _kernel_copy(fd_in, fd_out, size):
+    """Try the platform's in-kernel copy primitives; return False if none of them worked."""
+    if sys.platform == 'darwin':
+        copiers = [lambda: _fcopyfile(fd_in, fd_out)]
+    else:
+        copiers = []
+        if sys.platform.startswith('linux'):
+            copiers.append(lambda: _ficlone(fd_in, fd_out))
+        if hasattr(os, 'copy_file_range'):
+            copiers.append(lambda: _copy_file_range(fd_in, fd_out, size))
+        if hasattr(os, 'sendfile'):
+            copiers.append(lambda: _sendfile(fd_in, fd_out, size))
+    
+    # Start at the method that last worked between these two file systems, skipping ones known to fail
+    devices = (os.fstat(fd_in).st_dev, os.fstat(fd_out).st_dev)
+    first = _kernel_copier_index.get(devices, 0)
+    for index, copier in enumerate(copiers[first:], first):
+        try:
+            copier()
+            _kernel_copier_index[devices] = index
+            return True
+        except (OSError, AttributeError):
+            # Discard any partial output before trying the next method
+            os.lseek(fd_out, 0, os.SEEK_SET)
+            os.ftruncate(fd_out, 0)
+    return False
+
+def fast_copy(src, dst):
+    """Copy src to dst using the fastest copy the platform offers, preserving timestamps like shutil.copy2."""
+    # Copy-on-write clones are tried first so no data is moved. Hard links are not an option:
+    # EU4 rewrites the autosave in place, which would change a hard-linked backup too.
+    if sys.platform == 'win32':
+        try:
+            _copy_file2(src, dst)
+            return
+        except (AttributeError, OSError):
+            pass  # CopyFile2 needs Windows 8+; use the portable copy below
+    elif sys.platform == 'darwin':
+        try:
+            _clonefile(src, dst)  # Keeps timestamps itself
+            return
+        except (AttributeError, OSError):
+            pass  # Not on APFS; copy the data below
+    
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        st = os.fstat(fsrc.fileno())
+        _advise_sequential(fsrc.fileno())
+        if not _kernel_copy(fsrc.fileno(), fdst.fileno(), st.st_size):
+            shutil.copyfileobj(fsrc, fdst, COPY_BUFSIZE)
+        fdst.flush()
+        _drop_from_page_cache(fdst.fileno())
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+def is_zip_file(path):
+    """Check whether the file is a zip archive (compressed ironman saves)."""
+    with open(path, 'rb') as f:
+        return f.read(len(ZIP_MAGIC)) == ZIP_MAGIC
+
+def compress_copy(src, dst):
+    """Write a zstd-compressed copy of src to dst, preserving timestamps."""
+    cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        st = os.fstat(fsrc.fileno())
+        _advise_sequential(fsrc.fileno())
+        cctx.copy_stream(fsrc, fdst, size=st.st_size, read_size=COPY_BUFSIZE, write_size=COPY_BUFSIZE)
+        fdst.flush()
+        _drop_from_page_cache(fdst.fileno())
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+# Signature of the last backed-up content, per source file
+_last_backup_signature = {}
+
+@functools.lru_cache(maxsize=4)
+def backup_path_prefix(backup_dir):
+    """Return the path prefix shared by all backup files in backup_dir."""
+    return os.path.join(backup_dir, BACKUP_NAME_PREFIX)
+
+def backup_save(source, backup_dir, settings, st=None):
+    """Copy the save file into the backup directory and prune old backups."""
+    # Country tag, in-game date and content signature, all from one read of the save header
+    tag, save_date, signature = get_save_info(source, st)
+    current_year = save_date[0] if save_date else None
+    
+    # Skip saves whose in-game date matches the last backup (at the configured granularity)
+    cache = load_backup_cache()
+    dedup_by = settings.get('dedup_by', DEFAULT_SETTINGS['dedup_by'])
+    date_parts = DEDUP_DATE_PARTS.get(dedup_by, 0)
+    last_date = cache['last_dates'].get(source)
+    if date_parts and save_date and last_date and tuple(last_date[:date_parts]) == save_date[:date_parts]:
+        log(f"Same in-game {dedup_by} as the last backup ({'.'.join(map(str, save_date))}), skipping", color='yellow', emoji='⏭️')
+        return
+    
+    # Skip saves that were rewritten without changing their content
+    if signature is not None and _last_backup_signature.get(source) == signature:
+        log("Save file unchanged, skipping backup", color='yellow', emoji='⏭️')
+        return
+    t = time.localtime()  # Format the timestamp from the struct fields, no strftime needed
+    timestamp = f'{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}_{t.tm_hour:02d}-{t.tm_min:02d}-{t.tm_sec:02d}'
+    backup_path = f'{backup_path_prefix(backup_dir)}{tag}_{timestamp}.eu4'  # Build backup path
+    backup_name = os.path.basename(backup_path)  # Backup filename for the log
+    if settings.get('compress', False) and zstandard is not None and not is_zip_file(source):
+        backup_name += ZSTD_SUFFIX
+        backup_path += ZSTD_SUFFIX
+        compress_copy(source, backup_path)  # Copy the save file, compressed
+    else:
+        fast_copy(source, backup_path)  # Copy the save file
+    _last_backup_signature[source] = signature
+    log(f'💾 Backup created: {backup_name}', color='green', emoji='✅')
+    if save_date:
+        cache['last_dates'][source] = list(save_date)
+        save_backup_cache(cache)
+    # Cleanup old backups based on in-game year
+    keep_years = settings.get('keep_years', DEFAULT_SETTINGS.get('keep_years', 'all'))
+    if current_year is not None:
+        cleanup_old_backups(backup_dir, current_year, keep_years)
+
+# Pending backups for the background worker; extra saves are dropped while it is busy
+_backup_queue = queue.Queue(maxsize=4)
+
+def backup_worker():
+    """Run queued backups in the background so the monitor loop never blocks on a copy."""
+    while True:
+        source, backup_dir, settings, st = _backup_queue.get()
+        try:
+            backup_save(source, backup_dir, settings, st)
+        except Exception as e:
+            log(f"❌ Backup failed: {e}", color='red', emoji='❌')
+        finally:
+            _backup_queue.task_done()
+
+def queue_backup(source, backup_dir, settings, st=None):
+    """Hand a backup over to the background worker, along with the source's os.stat result if known."""
+    try:
+        _backup_queue.put_nowait((source, backup_dir, settings, st))
+    except queue.Full:
+        log("Backup worker is busy, skipping this save", color='yellow', emoji='⚠️')
+
+def wait_for_backups():
+    """Block until all queued backups have been written."""
+    if _backup_queue.unfinished_tasks:
+        log("Waiting for pending backups to finish...", color='blue', emoji='⏳')
+        _backup_queue.join()
+
+# Queued by the watcher when the writer closed the save file (Linux IN_CLOSE_WRITE)
+SAVE_CLOSED = 'closed'
+SAVE_CHANGED = 'changed'
+
+class AutosaveEventHandler(FileSystemEventHandler):
+    """Queue a notification whenever the watched save file is written."""
+
+    def __init__(self, source, events):
+        super().__init__()
+        self.filename = os.path.normcase(os.path.basename(source))
+        self.events = events
+
+    def _notify(self, path, kind=SAVE_CHANGED):
+        if os.path.normcase(os.path.basename(path)) == self.filename:
+            self.events.put(kind)
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._notify(event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._notify(event.src_path)
+
+    def on_moved(self, event):
+        # EU4 may write to a temporary file and rename it over the autosave
+        if not event.is_directory:
+            self._notify(event.dest_path, SAVE_CLOSED)
+
+    def on_closed(self, event):
+        # Only reported by inotify: the save is complete, no need to wait for it to settle
+        if not event.is_directory:
+            self._notify(event.src_path, SAVE_CLOSED)
+
+def start_watcher(source, events):
+    """Start an OS-level file watcher for the save file, or return None to fall back to polling."""
+    if Observer is None:
+        return None
+    try:
+        observer = Observer()
+        observer.schedule(AutosaveEventHandler(source, events), os.path.dirname(source), recursive=False)
+        observer.daemon = True
+        observer.start()
+        return observer
+    except Exception as e:
+        log(f"Could not start file watcher, falling back to polling: {e}", color='yellow', emoji='⚠️')
+        return None
+
+def stop_watcher(observer):
+    """Stop a watcher started by start_watcher."""
+    if observer is not None:
+        observer.stop()
+        observer.join(timeout=2)
+
+def wait_for_quiet(events, settle=1.0):
+    """Drain queued change events until the save is closed or has been quiet for `settle` seconds."""
+    while True:
+        try:
+            if events.get(timeout=settle) == SAVE_CLOSED:
+                break
+        except queue.Empty:
+            return
+    # Drop notifications that arrived together with the close
+    while True:
+        try:
+            events.get_nowait()
+        except queue.Empty:
+            return
+
+def is_save_stable(path, st, delay=SAVE_STABLE_DELAY):
+    """Check that the save's size and mtime are unchanged after `delay` seconds (not caught mid-write)."""
+    time.sleep(delay)
+    later = get_stat(path)
+    return later is not None and (later.st_size, later.st_mtime_ns) == (st.st_size, st.st_mtime_ns)
 
 # Load settings and initialize
 settings = load_settings()
@@ -657,88 +1142,151 @@ elif source_invalid or backup_invalid:
     elif choice == '3':
         log("Continuing with potentially invalid settings...", color='yellow', emoji='⚠️')
 
+# Set by the keyboard listener when Ctrl+Q is pressed during monitoring
+_quit_event = threading.Event()
+
+def _read_key_win():
+    """Block until a key is pressed and return it as a single byte."""
+    return msvcrt.getch()
+
+def _read_key_posix():
+    """Block until a key is pressed and return it as a single byte (b'' once stdin is closed)."""
+    # Read the descriptor directly; a daemon thread blocked inside sys.stdin would hang interpreter exit
+    return os.read(sys.stdin.fileno(), 1)
+
+read_key = _read_key_win if sys.platform == "win32" else _read_key_posix
+
+def keyboard_listener(wake_queue):
+    """Wait for Ctrl+Q in the background, then stop monitoring and wake the main loop."""
+    while True:
+        key = read_key()
+        if key == b'\x11':  # Ctrl+Q
+            break
+        if key == b'':  # stdin was closed
+            return
+    _quit_event.set()
+    wake_queue.put(None)
+
+def enter_monitor_terminal_mode():
+    """Switch a POSIX terminal to unbuffered, unechoed input with flow control off, so Ctrl+Q is delivered.
+
+    Returns the previous terminal attributes, or None if nothing was changed.
+    """
+    if termios is None or not sys.stdin.isatty():
+        return None
+    fd = sys.stdin.fileno()
+    old_attrs = termios.tcgetattr(fd)
+    attrs = termios.tcgetattr(fd)
+    attrs[0] &= ~termios.IXON  # Ctrl+Q is XON otherwise
+    attrs[3] &= ~(termios.ICANON | termios.ECHO)
+    attrs[6][termios.VMIN] = 1
+    attrs[6][termios.VTIME] = 0
+    termios.tcsetattr(fd, termios.TCSADRAIN, attrs)
+    return old_attrs
+
+def restore_terminal_mode(old_attrs):
+    """Restore terminal attributes saved by enter_monitor_terminal_mode."""
+    if old_attrs is not None:
+        termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, old_attrs)
+
+def _wait_for_event_posix(events, timeout=None):
+    """Return the next queued event, or None once `timeout` seconds have passed (None waits forever)."""
+    try:
+        return events.get(timeout=timeout)
+    except queue.Empty:
+        return None
+
+def _wait_for_event_win(events, timeout=None):
+    """Like _wait_for_event_posix, but wakes up once a second because Ctrl+C cannot interrupt a lock wait on Windows."""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        wait = 1.0 if deadline is None else min(1.0, deadline - time.monotonic())
+        if wait <= 0:
+            return None
+        try:
+            return events.get(timeout=wait)
+        except queue.Empty:
+            pass
+
+wait_for_event = _wait_for_event_win if sys.platform == "win32" else _wait_for_event_posix
+
 # Show menu before starting backup loop
 settings_menu(settings)
-SOURCE = settings.get('SOURCE', DEFAULT_SETTINGS['SOURCE'])
-BACKUP_DIR = settings.get('BACKUP_DIR', DEFAULT_SETTINGS['BACKUP_DIR'])
-interval = settings.get('interval', DEFAULT_SETTINGS['interval'])
-log(f"Monitoring EU4 autosave file for changes every {interval}s", color='blue', emoji='🔍')
-log(f"📂 Source: {SOURCE}", color='blue')
-log(f"💾 Backups: {BACKUP_DIR}", color='blue')
-log("Press Ctrl+Q to stop monitoring and return to menu", color='yellow', emoji='ℹ️')
-log("Or press Ctrl+C to exit completely", color='yellow', emoji='ℹ️')
-heartbeat = 0
-
-# Get the initial modification time of the save file
-last_mtime = get_mtime(SOURCE)
-
-# Import for non-blocking input
-import select
-import sys
-
-def check_for_quit():
-    """Check if user wants to quit monitoring (Ctrl+Q detection)."""
-    if sys.platform == "win32":
-        import msvcrt
-        if msvcrt.kbhit():
-            key = msvcrt.getch()
-            # Check for Ctrl+Q (ASCII 17 or ord('q') with Ctrl modifier)
-            if key == b'\x11':  # Ctrl+Q
-                return True
-    else:
-        # Unix/Linux/Mac - use select
-        if select.select([sys.stdin], [], [], 0) == ([sys.stdin], [], []):
-            key = sys.stdin.read(1)
-            if ord(key) == 17:  # Ctrl+Q
-                return True
-    return False
+threading.Thread(target=backup_worker, daemon=True).start()
+observer = None
+terminal_attrs = None
+resumed = False
 
 # Main monitoring loop
 try:
     while True:
-        time.sleep(1)  # Check every second for responsiveness
-        heartbeat += 1
+        SOURCE = settings.get('SOURCE', DEFAULT_SETTINGS['SOURCE'])
+        BACKUP_DIR = settings.get('BACKUP_DIR', DEFAULT_SETTINGS['BACKUP_DIR'])
+        interval = settings.get('interval', DEFAULT_SETTINGS['interval'])
+        change_events = queue.Queue()
+        observer = start_watcher(SOURCE, change_events)
+        started = "Resumed monitoring" if resumed else "Monitoring EU4 autosave file for changes"
+        if observer is not None:
+            log(f"{started} (file system events)", color='blue', emoji='🔍')
+        else:
+            log(f"{started} every {interval}s", color='blue', emoji='🔍')
+        log(f"📂 Source: {SOURCE}", color='blue')
+        log(f"💾 Backups: {BACKUP_DIR}", color='blue')
+        log("Press Ctrl+Q to stop monitoring and return to menu", color='yellow', emoji='ℹ️')
+        log("Or press Ctrl+C to exit completely", color='yellow', emoji='ℹ️')
         
-        # Check if user wants to quit
-        if check_for_quit():
-            log("Returning to settings menu...", color='blue', emoji='↩️')
-            settings_menu(settings)
-            # Reset variables after returning from menu
-            SOURCE = settings.get('SOURCE', DEFAULT_SETTINGS['SOURCE'])
-            BACKUP_DIR = settings.get('BACKUP_DIR', DEFAULT_SETTINGS['BACKUP_DIR'])
-            interval = settings.get('interval', DEFAULT_SETTINGS['interval'])
-            log(f"Resumed monitoring every {interval}s", color='blue', emoji='🔍')
-            log(f"📂 Source: {SOURCE}", color='blue')
-            log(f"💾 Backups: {BACKUP_DIR}", color='blue')
-            log("Press Ctrl+Q to stop monitoring and return to menu", color='yellow', emoji='ℹ️')
-            log("Or press Ctrl+C to exit completely", color='yellow', emoji='ℹ️')
-            heartbeat = 0
-            last_mtime = get_mtime(SOURCE)
-            continue
+        # Get the initial modification time of the save file
+        source_stat = get_stat(SOURCE)
+        last_mtime = source_stat.st_mtime_ns if source_stat else None
+        # Deadlines on the monotonic clock keep the poll cadence steady however long a check takes
+        next_check = time.monotonic() + interval
+        next_status = time.monotonic() + 10
+        
+        _quit_event.clear()
+        if sys.stdin.isatty():
+            terminal_attrs = enter_monitor_terminal_mode()
+            threading.Thread(target=keyboard_listener, args=(change_events,), daemon=True).start()
         
-        # Only check file changes at the specified interval
-        if heartbeat % interval == 0:
-            current_mtime = get_mtime(SOURCE)  # Check if the save file has changed
+        while not _quit_event.is_set():
+            # Sleep until the OS reports a write, the poll interval passes, or Ctrl+Q is pressed
+            timeout = None if observer is not None else max(0.0, next_check - time.monotonic())
+            event = wait_for_event(change_events, timeout)
+            if _quit_event.is_set():
+                break
+            if event is None:
+                now = time.monotonic()
+                next_check = max(next_check + interval, now)
+                # Print status at most every 10 seconds
+                if now >= next_status:
+                    log("Watching for file changes...", color='yellow', emoji='👀')
+                    next_status = now + 10
+            elif event == SAVE_CHANGED:
+                # EU4 writes the save in several chunks; wait until it is done
+                wait_for_quiet(change_events)
+            # SAVE_CLOSED: the writer is done, check the save right away
             
-            # Print status every 10 seconds
-            if heartbeat % 10 == 0:
-                log("Watching for file changes...", color='yellow', emoji='👀')
+            # One stat per check; the worker reuses it instead of stating the save again
+            source_stat = get_stat(SOURCE)  # Check if the save file has changed
+            current_mtime = source_stat.st_mtime_ns if source_stat else None
             
             # If the file has changed, create a backup
             if current_mtime and current_mtime != last_mtime:
-                tag = get_player_tag(SOURCE)  # Get the country tag
-                timestamp = time.strftime('%Y-%m-%d_%H-%M-%S')  # Format the timestamp
-                backup_name = f'mp_autosave_{tag}_{timestamp}.eu4'  # Build backup filename
-                backup_path = os.path.join(BACKUP_DIR, backup_name)  # Build backup path
-                shutil.copy2(SOURCE, backup_path)  # Copy the save file
-                log(f'💾 Backup created: {backup_name}', color='green', emoji='✅')
-                # Cleanup old backups based on in-game year
-                current_year = get_save_year(SOURCE)
-                keep_years = settings.get('keep_years', DEFAULT_SETTINGS.get('keep_years', 'all'))
-                if current_year is not None:
-                    cleanup_old_backups(BACKUP_DIR, current_year, keep_years)
+                # Without file events a poll can land mid-write (e.g. on synced folders); retry next poll
+                if event is None and not is_save_stable(SOURCE, source_stat):
+                    continue
+                queue_backup(SOURCE, BACKUP_DIR, settings, source_stat)
                 last_mtime = current_mtime  # Update last_mtime
+        
+        stop_watcher(observer)
+        restore_terminal_mode(terminal_attrs)
+        terminal_attrs = None
+        log("Returning to settings menu...", color='blue', emoji='↩️')
+        settings_menu(settings)
+        resumed = True
                 
 except KeyboardInterrupt:
+    stop_watcher(observer)
+    restore_terminal_mode(terminal_attrs)
+    wait_for_backups()
     log("Goodbye!", color='blue', emoji='👋')
     exit(0)